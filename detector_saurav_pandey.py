@@ -9,78 +9,206 @@ Handles both individual PII elements and combinations that create PII.
 """
 
 import sys
+import os
 import csv
+import itertools
+import io
 import json
 import re
+import stat
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Set, Any
 
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator, fall back to the re module
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:  # Optional fast JSON parser, fall back to the json module
+    orjson = None
+
+try:
+    import pyarrow
+    import pyarrow.csv as pyarrow_csv
+except ImportError:  # Optional columnar reader, fall back to the csv module
+    pyarrow = pyarrow_csv = None
+
+# Input columns that may hold the JSON record, in lookup order
+JSON_COLUMNS = ('Data_json', 'data_json')
+CSV_BLOCK_SIZE = 8 << 20
+# File buffer size for input and output, to cut read/write syscalls on large files
+IO_BUFFER_SIZE = 1 << 20
+# Records handed to a worker process at a time
+CHUNK_SIZE = 10000
+# Fixed output schema: record_id, redacted_data_json, is_pii
+OUTPUT_HEADER = b'record_id,redacted_data_json,is_pii\r\n'
+
+
 # Pattern definitions for various PII types
-PHONE_REGEX = re.compile(r'\b(\d{10})\b')
-AADHAAR_REGEX = re.compile(r'\b(\d{4}\s?\d{4}\s?\d{4})\b')
 PASSPORT_REGEX = re.compile(r'\b([A-PR-WYa-pr-wy][1-9]\d{6})\b')
-UPI_REGEX = re.compile(r'\b[\w.-]+@[\w.-]+\b')
-EMAIL_REGEX = re.compile(r'[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+')
-IP_REGEX = re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b')
+EMAIL_REGEX = re.compile(r'[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9.-]+')
 ADDRESS_REGEX = re.compile(r'\d+\s+\w+.*\d{6}')
 
+# Whole-field patterns for standalone values, with the prefix rules folded in
+MOBILE_NUMBER_REGEX = re.compile(r'[6-9]\d{9}')
+AADHAAR_NUMBER_REGEX = re.compile(r'[1-9]\d{3}\s?\d{4}\s?\d{4}')
+PIN_CODE_REGEX = re.compile(r'\d{6}')
+# UPI handles carry no dot after the '@', which tells them apart from email addresses
+UPI_ID_REGEX = re.compile(r'[\w.-]+@[a-zA-Z]+')
 
-class DataRedactor:
-    """Handles redaction of different PII types with appropriate masking patterns"""
-    
-    @staticmethod
-    def redact_phone(phone_number):
-        """Redacts phone number while preserving first and last two digits"""
-        return phone_number[:2] + 'XXXXXX' + phone_number[-2:]
-    
-    @staticmethod
-    def redact_aadhaar(aadhaar_number):
-        """Redacts Aadhaar number while preserving first and last two digits"""
-        cleaned = aadhaar_number.replace(' ', '')
-        return cleaned[:2] + 'XXXXXXXX' + cleaned[-2:]
-    
-    @staticmethod
-    def redact_passport(passport_number):
-        """Redacts passport number while preserving first character"""
-        return passport_number[0] + 'XXXXXXX'
-    
-    @staticmethod
-    def redact_email(email_address):
-        """Redacts email while keeping domain and partial username visible"""
-        username, domain = email_address.split('@')
-        if len(username) > 2:
-            return username[:2] + 'XXX' + '@' + domain
-        return 'X' * len(username) + '@' + domain
-    
-    @staticmethod
-    def redact_name(full_name):
-        """Redacts name while preserving first letter of each word"""
-        words = full_name.split()
-        redacted_words = []
-        for word in words:
-            if len(word) > 1:
-                redacted_words.append(word[0] + 'XXX')
-            else:
-                redacted_words.append(word)
-        return ' '.join(redacted_words)
-    
-    @staticmethod
-    def redact_upi(upi_identifier):
-        """Redacts UPI ID while keeping domain visible"""
-        username, domain = upi_identifier.split('@')
-        if len(username) > 2:
-            return username[:2] + 'XXX@' + domain
-        return 'X' * len(username) + '@' + domain
+# Repairs for common JSON formatting issues (unquoted dates and identifiers)
+JSON_DATE_FIX_REGEX = re.compile(r'(:\s*)(\d{4}[-/.]\d{2}[-/.]\d{2})([\s,}])')
+JSON_IDENTIFIER_FIX_REGEX = re.compile(r'(:\s*)([a-zA-Z_][a-zA-Z0-9_]*)([\s,}])')
+
+# Words of two or more characters in a name, masked after their first character
+NAME_WORD_REGEX = re.compile(r'(\S)\S+')
+
+# Fields checked by the standalone and combination passes, for early exits
+STANDALONE_FIELDS = frozenset({'phone', 'aadhar', 'passport', 'upi_id'})
+COMBINATION_FIELDS = frozenset({'name', 'email', 'address', 'ip_address', 'device_id',
+                                'first_name', 'last_name', 'city', 'pin_code'})
+
+# Fields already handled as direct PII, skipped by the free-text scan
+SKIP_TEXTSCAN_FIELDS = frozenset({'name', 'email', 'address', 'phone', 'aadhar', 'passport', 'upi_id'})
+
+# Patterns searched for inside free-text fields, in priority order
+EMBEDDED_PII_PATTERNS = (
+    ('aadhaar', r'\b[1-9]\d{3} ?\d{4} ?\d{4}\b'),
+    ('phone', r'\b[6-9]\d{9}\b'),
+    ('email', EMAIL_REGEX.pattern),
+)
+# All embedded patterns as named alternatives, so one pass finds every kind
+EMBEDDED_PII_REGEX = re.compile(
+    '|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in EMBEDDED_PII_PATTERNS)
+)
+
+# Fewest digits an embedded numeric match needs (a phone number)
+MIN_EMBEDDED_DIGITS = 10
+# Every byte except the ASCII digits, deleted to count digits in one C-level pass
+_NON_DIGIT_BYTES = bytes(byte for byte in range(256) if not 0x30 <= byte <= 0x39)
+
+
+def _compile_embedded_database():
+    """Compiles all embedded PII patterns into a single Hyperscan prefilter database"""
+    if hyperscan is None:
+        return None, None
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=[pattern.encode('ascii') for _, pattern in EMBEDDED_PII_PATTERNS],
+        ids=list(range(len(EMBEDDED_PII_PATTERNS))),
+        elements=len(EMBEDDED_PII_PATTERNS),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(EMBEDDED_PII_PATTERNS),
+    )
+    return database, hyperscan.Scratch(database)
+
+
+EMBEDDED_DATABASE, EMBEDDED_SCRATCH = _compile_embedded_database()
+
+
+def apply_replacements(text, replacements):
+    """Rebuilds text with sorted, non-overlapping (start, end, replacement) spans in one pass"""
+    parts = []
+    position = 0
+    for start, end, replacement in replacements:
+        parts.append(text[position:start])
+        parts.append(replacement)
+        position = end
+    parts.append(text[position:])
+    return ''.join(parts)
+
+
+def may_contain_embedded_pii(text):
+    """
+    Cheap prefilter deciding whether a text is worth scanning for embedded PII
+    Emails need an '@' and phone or Aadhaar numbers need at least ten digits
+    """
+    # Non-ASCII text is always scanned since \d also matches non-ASCII digits
+    if '@' in text or not text.isascii():
+        return True
+    return len(text.encode('ascii').translate(None, _NON_DIGIT_BYTES)) >= MIN_EMBEDDED_DIGITS
+
+
+def _hyperscan_has_match(text):
+    """Scans ASCII text with the Hyperscan database and stops at the first match"""
+    found = []
     
-    @staticmethod
-    def redact_address(address_text):
-        """Completely redacts address information"""
-        return '[REDACTED_PII]'
+    def on_match(pattern_id, start, end, flags, context):
+        found.append(pattern_id)
+        return True  # One match is enough to hand the text to the regex
     
-    @staticmethod
-    def redact_ip_address(ip_address):
-        """Redacts IP address while preserving first and last octets"""
-        octets = ip_address.split('.')
-        return octets[0] + '.XXX.XXX.' + octets[-1]
+    try:
+        EMBEDDED_DATABASE.scan(text.encode('ascii'), match_event_handler=on_match,
+                               scratch=EMBEDDED_SCRATCH)
+    except hyperscan.ScanTerminated:
+        # Raised when on_match stops the scan early
+        pass
+    return bool(found)
+
+
+def find_embedded_pii(text):
+    """
+    Finds embedded Aadhaar, phone and email values in a text
+    Returns sorted, non-overlapping (kind, start, end) spans
+    """
+    # Hyperscan only rules texts out; spans always come from the regex so both
+    # paths report the same matches. It works on bytes, so only ASCII text
+    # keeps its \b and \d semantics.
+    if EMBEDDED_DATABASE is not None and text.isascii() and not _hyperscan_has_match(text):
+        return []
+    return [(match.lastgroup, match.start(), match.end())
+            for match in EMBEDDED_PII_REGEX.finditer(text)]
+
+
+def redact_phone(phone_number):
+    """Redacts phone number while preserving first and last two digits"""
+    return phone_number[:2] + 'XXXXXX' + phone_number[-2:]
+
+
+def redact_aadhaar(aadhaar_number):
+    """Redacts Aadhaar number while preserving first and last two digits"""
+    cleaned = aadhaar_number.replace(' ', '')
+    return cleaned[:2] + 'XXXXXXXX' + cleaned[-2:]
+
+
+def redact_passport(passport_number):
+    """Redacts passport number while preserving first character"""
+    return passport_number[0] + 'XXXXXXX'
+
+
+def redact_email(email_address):
+    """Redacts email while keeping domain and partial username visible"""
+    username, domain = email_address.split('@')
+    if len(username) > 2:
+        return username[:2] + 'XXX' + '@' + domain
+    return 'X' * len(username) + '@' + domain
+
+
+def redact_name(full_name):
+    """Redacts name while preserving first letter of each word"""
+    # Collapse whitespace first so the output does not reveal the original layout
+    return NAME_WORD_REGEX.sub(r'\1XXX', ' '.join(full_name.split()))
+
+
+def redact_upi(upi_identifier):
+    """Redacts UPI ID while keeping domain visible"""
+    username, domain = upi_identifier.split('@')
+    if len(username) > 2:
+        return username[:2] + 'XXX@' + domain
+    return 'X' * len(username) + '@' + domain
+
+
+def redact_address(address_text):
+    """Completely redacts address information"""
+    return '[REDACTED_PII]'
+
+
+def redact_ip_address(ip_address):
+    """Redacts IP address while preserving first and last octets"""
+    octets = ip_address.split('.')
+    return octets[0] + '.XXX.XXX.' + octets[-1]
 
 
 class PIIValidator:
@@ -95,13 +223,21 @@ class PIIValidator:
     def is_valid_address(address_text):
         """Checks if text matches address pattern with PIN code"""
         return bool(ADDRESS_REGEX.search(address_text))
+    
+    @staticmethod
+    def is_valid_ip_address(ip_text):
+        """Checks if text is a dotted IPv4 address with four octets in 0-255"""
+        octets = ip_text.split('.')
+        return len(octets) == 4 and all(
+            len(octet) <= 3 and octet.isascii() and octet.isdigit() and int(octet) < 256
+            for octet in octets
+        )
 
 
 class PIIDetectionEngine:
     """Main engine for detecting and processing PII in data records"""
     
     def __init__(self):
-        self.redactor = DataRedactor()
         self.validator = PIIValidator()
     
     def analyze_record(self, record_data):
@@ -109,15 +245,19 @@ class PIIDetectionEngine:
         Analyzes a single record for PII and returns redacted version
         Returns tuple: (redacted_record, is_pii_present)
         """
-        redacted_data = record_data.copy()
+        # Redacted field values, applied to a copy of the record only if any remain
+        redactions = {}
         pii_detected = False
         combination_markers = set()
+        # Names of fields redacted by the combination pass
+        combination_fields = set()
         
         # Process standalone PII types (always considered sensitive)
-        pii_detected |= self._process_standalone_pii(record_data, redacted_data)
+        pii_detected |= self._process_standalone_pii(record_data, redactions)
         
         # Identify combinatorial PII elements
-        self._identify_combination_elements(record_data, redacted_data, combination_markers)
+        self._identify_combination_elements(record_data, redactions, combination_markers,
+                                            combination_fields)
         
         # Apply combinatorial logic (2+ elements = PII)
         # Special case: first_name + last_name is always PII
@@ -127,84 +267,101 @@ class PIIDetectionEngine:
         elif len(combination_markers) == 1 and not pii_detected:
             # Restore non-PII data if only single combination element (except first+last name)
             if not has_first_last_name:
-                self._restore_non_pii_data(record_data, redacted_data, combination_markers)
+                self._restore_non_pii_data(redactions, combination_fields)
         
         # Scan text fields for embedded PII
-        pii_detected |= self._scan_text_fields(record_data, redacted_data)
+        pii_detected |= self._scan_text_fields(record_data, redactions)
+        
+        if not redactions:
+            return record_data, pii_detected
         
+        redacted_data = record_data.copy()
+        redacted_data.update(redactions)
         return redacted_data, pii_detected
     
-    def _process_standalone_pii(self, original_data, redacted_data):
+    def _process_standalone_pii(self, original_data, redactions):
         """Process data types that are always considered PII"""
         pii_found = False
+        if original_data.keys().isdisjoint(STANDALONE_FIELDS):
+            return pii_found
         
         # Phone number processing
         if 'phone' in original_data:
             phone_str = str(original_data['phone'])
-            if PHONE_REGEX.fullmatch(phone_str) and phone_str[0] in '6789':
-                redacted_data['phone'] = self.redactor.redact_phone(phone_str)
+            if MOBILE_NUMBER_REGEX.fullmatch(phone_str) is not None:
+                redactions['phone'] = redact_phone(phone_str)
                 pii_found = True
         
         # Aadhaar number processing
         if 'aadhar' in original_data:
             aadhaar_str = str(original_data['aadhar']).replace(' ', '')
-            if AADHAAR_REGEX.fullmatch(aadhaar_str) and not aadhaar_str.startswith('0'):
-                redacted_data['aadhar'] = self.redactor.redact_aadhaar(str(original_data['aadhar']))
+            if AADHAAR_NUMBER_REGEX.fullmatch(aadhaar_str) is not None:
+                redactions['aadhar'] = redact_aadhaar(str(original_data['aadhar']))
                 pii_found = True
         
         # Passport number processing
         if 'passport' in original_data:
             passport_str = str(original_data['passport'])
             if PASSPORT_REGEX.fullmatch(passport_str):
-                redacted_data['passport'] = self.redactor.redact_passport(passport_str)
+                redactions['passport'] = redact_passport(passport_str)
                 pii_found = True
         
         # UPI ID processing
         if 'upi_id' in original_data:
             upi_str = str(original_data['upi_id'])
-            if UPI_REGEX.fullmatch(upi_str):
-                redacted_data['upi_id'] = self.redactor.redact_upi(upi_str)
+            if UPI_ID_REGEX.fullmatch(upi_str) is not None:
+                redactions['upi_id'] = redact_upi(upi_str)
                 pii_found = True
         
         return pii_found
     
-    def _identify_combination_elements(self, original_data, redacted_data, markers):
-        """Identify elements that form PII when combined"""
+    def _identify_combination_elements(self, original_data, redactions, markers, redacted_fields):
+        """
+        Identify elements that form PII when combined
+        Names of redacted fields are recorded in redacted_fields for restoration
+        """
+        if original_data.keys().isdisjoint(COMBINATION_FIELDS):
+            return
         
         # Full name analysis
         if 'name' in original_data:
             name_str = str(original_data['name'])
             if self.validator.is_valid_full_name(name_str):
                 markers.add('name')
-                redacted_data['name'] = self.redactor.redact_name(name_str)
+                redactions['name'] = redact_name(name_str)
+                redacted_fields.add('name')
         
         # Email address analysis
         if 'email' in original_data:
             email_str = str(original_data['email'])
             if EMAIL_REGEX.fullmatch(email_str):
                 markers.add('email')
-                redacted_data['email'] = self.redactor.redact_email(email_str)
+                redactions['email'] = redact_email(email_str)
+                redacted_fields.add('email')
         
         # Address analysis
         if 'address' in original_data:
             address_str = str(original_data['address'])
             if self.validator.is_valid_address(address_str):
                 markers.add('address')
-                redacted_data['address'] = self.redactor.redact_address(address_str)
+                redactions['address'] = redact_address(address_str)
+                redacted_fields.add('address')
         
         # IP address analysis
         if 'ip_address' in original_data:
             ip_str = str(original_data['ip_address'])
-            if IP_REGEX.fullmatch(ip_str):
+            if self.validator.is_valid_ip_address(ip_str):
                 markers.add('ip')
-                redacted_data['ip_address'] = self.redactor.redact_ip_address(ip_str)
+                redactions['ip_address'] = redact_ip_address(ip_str)
+                redacted_fields.add('ip_address')
         
         # Device ID analysis
         if 'device_id' in original_data:
             device_str = str(original_data['device_id'])
             if len(device_str) > 6:
                 markers.add('device')
-                redacted_data['device_id'] = '[REDACTED_PII]'
+                redactions['device_id'] = '[REDACTED_PII]'
+                redacted_fields.add('device_id')
         
         # First name + Last name combination
         if 'first_name' in original_data and 'last_name' in original_data:
@@ -212,79 +369,244 @@ class PIIDetectionEngine:
             last_name = str(original_data['last_name']).strip()
             if first_name and last_name:
                 markers.add('name')
-                redacted_data['first_name'] = self.redactor.redact_name(first_name)
-                redacted_data['last_name'] = self.redactor.redact_name(last_name)
+                redactions['first_name'] = redact_name(first_name)
+                redacted_fields.add('first_name')
+                redactions['last_name'] = redact_name(last_name)
+                redacted_fields.add('last_name')
         
         # City + PIN code combination
         if 'city' in original_data and 'pin_code' in original_data:
             pin_str = str(original_data['pin_code'])
             city_str = str(original_data['city']).strip()
-            if re.match(r'\d{6}', pin_str) and city_str:
+            if PIN_CODE_REGEX.match(pin_str) is not None and city_str:
                 markers.add('address')
-                redacted_data['city'] = '[REDACTED_PII]'
-                redacted_data['pin_code'] = '[REDACTED_PII]'
+                redactions['city'] = '[REDACTED_PII]'
+                redacted_fields.add('city')
+                redactions['pin_code'] = '[REDACTED_PII]'
+                redacted_fields.add('pin_code')
     
-    def _restore_non_pii_data(self, original_data, redacted_data, markers):
-        """Restore original data for non-PII single combination elements"""
-        for marker_type in markers:
-            if marker_type == 'name':
-                for field in ['name', 'first_name', 'last_name']:
-                    if field in original_data:
-                        redacted_data[field] = original_data[field]
-            elif marker_type == 'email' and 'email' in original_data:
-                redacted_data['email'] = original_data['email']
-            elif marker_type == 'address':
-                for field in ['address', 'city', 'pin_code']:
-                    if field in original_data:
-                        redacted_data[field] = original_data[field]
-            elif marker_type == 'ip' and 'ip_address' in original_data:
-                redacted_data['ip_address'] = original_data['ip_address']
-            elif marker_type == 'device' and 'device_id' in original_data:
-                redacted_data['device_id'] = original_data['device_id']
+    def _restore_non_pii_data(self, redactions, redacted_fields):
+        """
+        Restore original data for non-PII single combination elements
+        Only called with a single marker, so every redacted field belongs to it
+        and dropping its pending redaction leaves the original value in place
+        """
+        for field in redacted_fields:
+            del redactions[field]
     
-    def _scan_text_fields(self, original_data, redacted_data):
+    def _scan_text_fields(self, original_data, redactions):
         """Scan all text fields for embedded PII patterns"""
         pii_found = False
+        # Local bindings for the redactors called in the inner loops
+        mask_aadhaar, mask_phone, mask_email = redact_aadhaar, redact_phone, redact_email
         
         for field_name, field_value in original_data.items():
             if not isinstance(field_value, str):
                 continue
             
             # Skip fields already processed as direct PII
-            skip_fields = {'name', 'email', 'address', 'phone', 'aadhar', 'passport', 'upi_id'}
-            if field_name in skip_fields:
+            if field_name in SKIP_TEXTSCAN_FIELDS:
                 continue
             
-            modified_text = field_value
+            if not may_contain_embedded_pii(field_value):
+                continue
             
-            # Search for embedded phone numbers
-            for phone_match in PHONE_REGEX.finditer(field_value):
-                phone_num = phone_match.group(1)
-                if phone_num[0] in '6789':  # Valid Indian mobile prefixes
-                    masked_phone = self.redactor.redact_phone(phone_num)
-                    modified_text = modified_text.replace(phone_match.group(0), masked_phone)
-                    pii_found = True
+            replacements = []
+            for kind, start, end in find_embedded_pii(field_value):
+                matched_text = field_value[start:end]
+                if kind == 'aadhaar':
+                    replacements.append((start, end, mask_aadhaar(matched_text)))
+                elif kind == 'phone':
+                    replacements.append((start, end, mask_phone(matched_text)))
+                else:
+                    replacements.append((start, end, mask_email(matched_text)))
             
-            # Search for embedded email addresses
-            for email_match in EMAIL_REGEX.finditer(field_value):
-                masked_email = self.redactor.redact_email(email_match.group(0))
-                modified_text = modified_text.replace(email_match.group(0), masked_email)
+            if replacements:
+                redactions[field_name] = apply_replacements(field_value, replacements)
                 pii_found = True
-            
-            # Search for embedded Aadhaar numbers
-            for aadhaar_match in AADHAAR_REGEX.finditer(field_value):
-                aadhaar_num = aadhaar_match.group(1).replace(' ', '')
-                if len(aadhaar_num) == 12 and not aadhaar_num.startswith('0'):
-                    masked_aadhaar = self.redactor.redact_aadhaar(aadhaar_match.group(1))
-                    modified_text = modified_text.replace(aadhaar_match.group(0), masked_aadhaar)
-                    pii_found = True
-            
-            if modified_text != field_value:
-                redacted_data[field_name] = modified_text
         
         return pii_found
 
 
+def parse_json_record(json_content):
+    """Parses a JSON record with error recovery for common formatting issues"""
+    if orjson is not None:
+        try:
+            return orjson.loads(json_content)
+        except orjson.JSONDecodeError:
+            # The json module also accepts NaN and arbitrarily large integers
+            pass
+    
+    try:
+        return json.loads(json_content)
+    except json.JSONDecodeError:
+        # Attempt to fix common JSON formatting issues
+        fixed_json = JSON_DATE_FIX_REGEX.sub(r'\1"\2"\3', json_content)
+        fixed_json = JSON_IDENTIFIER_FIX_REGEX.sub(r'\1"\2"\3', fixed_json)
+        return json.loads(fixed_json)
+
+
+def _iter_arrow_records(input_file):
+    """Reads the input CSV in large blocks with PyArrow and yields records per batch"""
+    columns = ('record_id',) + JSON_COLUMNS
+    reader = pyarrow_csv.open_csv(
+        input_file,
+        read_options=pyarrow_csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        parse_options=pyarrow_csv.ParseOptions(newlines_in_values=True),
+        # Only the needed columns are converted, all as strings, so other columns
+        # can never fail type inference partway through the file
+        convert_options=pyarrow_csv.ConvertOptions(
+            column_types={column: pyarrow.string() for column in columns},
+            include_columns=list(columns),
+            include_missing_columns=True,
+        ),
+    )
+    
+    for batch in reader:
+        record_ids = batch.column(0)
+        if record_ids.null_count:
+            # Present cells are never null, so nulls mean the column is missing
+            raise KeyError('record_id')
+        json_values = [batch.column(index).to_pylist() for index in range(1, len(columns))]
+        for row_index, record_id in enumerate(record_ids.to_pylist()):
+            json_content = None
+            for values in json_values:
+                json_content = values[row_index]
+                if json_content:
+                    break
+            yield record_id, json_content
+
+
+def _iter_csv_records(input_file):
+    """Reads the input CSV row by row with csv.DictReader"""
+    text_file = io.TextIOWrapper(input_file, encoding='utf-8', newline='')
+    for row in csv.DictReader(text_file):
+        # Extract JSON data (handle different column names)
+        json_content = None
+        for column in JSON_COLUMNS:
+            json_content = row.get(column)
+            if json_content:
+                break
+        yield row['record_id'], json_content
+
+
+def iter_input_records(input_file):
+    """
+    Yields (record_id, json_content) pairs from a binary input CSV file
+    With PyArrow installed, regular files are memory-mapped and parsed
+    zero-copy; pipes and other inputs, or any input without PyArrow, are read
+    by csv.DictReader through a buffered TextIOWrapper
+    """
+    file_stat = os.fstat(input_file.fileno())
+    if pyarrow_csv is None or not stat.S_ISREG(file_stat.st_mode):
+        yield from _iter_csv_records(input_file)
+        return
+    
+    if file_stat.st_size == 0:
+        # Empty files hold no records (PyArrow rejects them)
+        return
+    
+    yielded = 0
+    try:
+        # Arrow maps the file by path and parses it zero-copy; input_file itself
+        # is only read if the csv fallback below takes over
+        with pyarrow.memory_map(input_file.name) as mapped_file:
+            for record in _iter_arrow_records(mapped_file):
+                yield record
+                yielded += 1
+    except pyarrow.ArrowInvalid:
+        # Rows with too few or too many cells are rejected by PyArrow but
+        # handled by csv.DictReader, which takes over after the records
+        # already yielded
+        input_file.seek(0)
+        yield from itertools.islice(_iter_csv_records(input_file), yielded, None)
+
+
+def iter_chunks(records, chunk_size):
+    """Groups an iterable of records into lists of at most chunk_size items"""
+    records = iter(records)
+    while chunk := list(itertools.islice(records, chunk_size)):
+        yield chunk
+
+
+# Detection engine owned by the current (worker) process
+_worker_detector = None
+
+
+def _init_worker():
+    """Initializes the PII detection engine once per process"""
+    global _worker_detector
+    _worker_detector = PIIDetectionEngine()
+
+
+def process_chunk(records):
+    """
+    Analyzes a chunk of (record_id, json_content) pairs for PII
+    Returns (record_id, redacted_json, is_pii) rows, skipping unusable records
+    """
+    results = []
+    for record_id, json_content in records:
+        if not json_content:
+            # Skip records without JSON data
+            continue
+        
+        # Clean and parse JSON data
+        if json_content.startswith('"') and json_content.endswith('"'):
+            json_content = json_content[1:-1]
+        json_content = json_content.replace('""', '"')
+        
+        try:
+            parsed_record = parse_json_record(json_content)
+        except Exception as error:
+            # Skip malformed records silently
+            continue
+        
+        # Analyze record for PII
+        redacted_record, contains_pii = _worker_detector.analyze_record(parsed_record)
+        results.append((record_id, json.dumps(redacted_record, ensure_ascii=False), str(contains_pii)))
+    return results
+
+
+def iter_processed_chunks(chunks, max_workers):
+    """
+    Yields processed chunks in input order
+    Fans out to a process pool when there is more than one chunk and more than one core
+    """
+    leading = list(itertools.islice(chunks, 2))
+    chunks = itertools.chain(leading, chunks)
+    
+    if len(leading) < 2 or max_workers <= 1:
+        _init_worker()
+        for chunk in chunks:
+            yield process_chunk(chunk)
+        return
+    
+    # Keep a bounded number of chunks in flight so large inputs are not read into memory at once
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(process_chunk, chunk))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _quote_csv_field(value):
+    """Quotes a CSV field only when needed, matching csv.writer's QUOTE_MINIMAL"""
+    if value is None:
+        # Missing cells from csv.DictReader are written as empty fields
+        return ''
+    if '"' in value or ',' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def format_output_row(record_id, redacted_json, is_pii):
+    """Formats one output CSV row; is_pii is always 'True' or 'False' and never quoted"""
+    return f'{_quote_csv_field(record_id)},{_quote_csv_field(redacted_json)},{is_pii}\r\n'
+
+
 def process_csv_data():
     """Main function to process CSV file and generate redacted output"""
     if len(sys.argv) != 2:
@@ -294,55 +616,19 @@ def process_csv_data():
     input_filename = sys.argv[1]
     output_filename = 'redacted_output_saurav_pandey_name.csv'
     
-    # Initialize the PII detection engine
-    detector = PIIDetectionEngine()
-    
     try:
-        with open(input_filename, newline='', encoding='utf-8') as input_file, \
-             open(output_filename, 'w', newline='', encoding='utf-8') as output_file:
+        with open(input_filename, 'rb', buffering=IO_BUFFER_SIZE) as input_file, \
+             open(output_filename, 'wb', buffering=IO_BUFFER_SIZE) as output_file:
             
-            reader = csv.DictReader(input_file)
-            output_columns = ['record_id', 'redacted_data_json', 'is_pii']
-            writer = csv.DictWriter(output_file, fieldnames=output_columns)
-            writer.writeheader()
+            output_file.write(OUTPUT_HEADER)
             
-            for row in reader:
-                record_id = row['record_id']
-                
-                # Extract JSON data (handle different column names)
-                json_content = row.get('Data_json') or row.get('data_json')
-                
-                if not json_content:
-                    # Skip records without JSON data
-                    continue
-                
-                # Clean and parse JSON data
-                if json_content.startswith('"') and json_content.endswith('"'):
-                    json_content = json_content[1:-1]
-                json_content = json_content.replace('""', '"')
-                
-                try:
-                    # Parse JSON with error recovery
-                    try:
-                        parsed_record = json.loads(json_content)
-                    except json.JSONDecodeError:
-                        # Attempt to fix common JSON formatting issues
-                        fixed_json = re.sub(r'(:\s*)(\d{4}[-/.]\d{2}[-/.]\d{2})([\s,}])', r'\1"\2"\3', json_content)
-                        fixed_json = re.sub(r'(:\s*)([a-zA-Z_][a-zA-Z0-9_]*)([\s,}])', r'\1"\2"\3', fixed_json)
-                        parsed_record = json.loads(fixed_json)
-                except Exception as error:
-                    # Skip malformed records silently
-                    continue
-                
-                # Analyze record for PII
-                redacted_record, contains_pii = detector.analyze_record(parsed_record)
-                
-                # Write result to output file
-                writer.writerow({
-                    'record_id': record_id,
-                    'redacted_data_json': json.dumps(redacted_record, ensure_ascii=False),
-                    'is_pii': str(contains_pii)
-                })
+            chunks = iter_chunks(iter_input_records(input_file), CHUNK_SIZE)
+            for results in iter_processed_chunks(chunks, os.cpu_count() or 1):
+                # Write each chunk of results to the output file in one call
+                output_file.write(''.join(
+                    format_output_row(record_id, redacted_json, contains_pii)
+                    for record_id, redacted_json, contains_pii in results
+                ).encode('utf-8'))
         
         print(f'Processing completed successfully. Output saved to {output_filename}')
         